@@ -64,6 +64,14 @@ def main() -> None:
         "--word-frequency-file",
         help="File containing words and their relative frequency",
     )
+    parser.add_argument(
+        "-x",
+        "--entropy",
+        help="Choose guesses by expected information gain "
+        + "(slow on large word lists)",
+        action="store_true",
+        default=False,
+    )
     args = parser.parse_args()
     solver = WordleSolver(
         word_list_file=args.file,
@@ -76,6 +84,7 @@ def main() -> None:
         answer=args.answer,
         initial_guess=args.initial_guess,
         relax_repeats=args.relax_repeats,
+        entropy=args.entropy,
         top=args.top,
     )
     solver.main_loop()
@@ -3,12 +3,46 @@ This is the main class for a Wordle solver.
 """
 
 import logging
-import re
-from typing import Dict, List, Mapping, Set, Union
+from collections import Counter
+from functools import lru_cache
+from heapq import nlargest
+from math import log2
+from operator import itemgetter
+from typing import Dict, List, Mapping, Optional, Set, Tuple, Union
 
 from .exceptions import AnswerFound, OutOfGuesses
 
 
+@lru_cache(maxsize=8)
+def read_words(filename: str, length: int) -> Tuple[str, ...]:
+    """
+    Read a word-list file and return its words of the given length,
+    lowercased, deduplicated, and sorted.  Memoized at module level so
+    that building several solvers over the same file (again, the test
+    suite) parses it once; the tuple is immutable, so sharing is safe.
+    """
+    # Lowercase the whole buffer in one C-level pass, then dedup and
+    # length-filter in a single comprehension, rather than making
+    # three full passes with two big intermediate lists.  Sorting the
+    # survivors costs little and makes the candidate order (and hence
+    # tie-breaking between equally-weighted guesses) deterministic
+    # instead of hash-dependent.
+    with open(filename, encoding="utf-8") as f:
+        text = f.read().lower()
+    return tuple(sorted({w for w in text.split() if len(w) == length}))
+
+
+@lru_cache(maxsize=8)
+def count_characters(words: Tuple[str, ...]) -> Counter:
+    """
+    Count character occurrences across a word list.  This lives at module
+    level, memoized, so that several solvers built over the same list (the
+    test suite does exactly that) share one counting pass.  Treat the
+    returned Counter as read-only; it's shared between callers.
+    """
+    return Counter("".join(words))
+
+
 class WordleSolver:
     """
     Solve a Wordle-style puzzle.  Word length and whether to use word
@@ -26,12 +60,47 @@ class WordleSolver:
     # pylint: disable="logging-not-lazy"
     # pylint: disable="logging-fstring-interpolation"
 
+    # All those attributes get slots: fixed-offset loads are quicker than
+    # __dict__ lookups, and the hot loops here are full of self.<x>.
+    # (re_list is a property, so it must not appear in this list.)
+    __slots__ = (
+        "answer",
+        "applied_state",
+        "attempt",
+        "char_weight_lut",
+        "character_frequency",
+        "current_guess",
+        "easy_mode",
+        "entropy",
+        "exclude_mask",
+        "fixed_letters",
+        "forbidden_masks",
+        "guessed",
+        "include_mask",
+        "lane_bits",
+        "log",
+        "match_pattern",
+        "max_guesses",
+        "packed_bits",
+        "position_bits",
+        "relax_repeats",
+        "response_codes",
+        "top",
+        "unique_counts",
+        "word_frequency",
+        "word_length",
+        "word_masks",
+        "word_weights",
+        "wordlist",
+    )
+
     def __init__(
         self,
         word_list_file: str = "/usr/share/dict/words",
         word_length: int = 5,
         easy_mode: bool = False,
         relax_repeats: bool = False,
+        entropy: bool = False,
         answer: str = "",
         guesses: int = 6,
         initial_guess: str = "",
@@ -53,14 +122,35 @@ class WordleSolver:
         if easy_mode:
             raise NotImplementedError("Easy mode not yet implemented")
         self.relax_repeats = relax_repeats
-        self.exclude_letters: Set[str] = set()
-        self.include_letters: Set[str] = set()
+        self.entropy = entropy
+        # The known-present and known-absent letters live as bitmasks;
+        # the include_letters/exclude_letters properties render them as
+        # the sets the rest of the world (and the tests) expect.
+        self.exclude_mask: int = 0
+        self.include_mask: int = 0
         self.word_length: int = word_length
         self.current_guess = initial_guess
-        self.re_list: List[str] = ["^"]
-        for _ in range(word_length):
-            self.re_list.append(".")
-        self.re_list.append("$")
+        # The positional constraints are kept as bitmasks, which is what
+        # apply_patterns filters with; a letter at a fixed position, or
+        # forbidden at a position, is one set bit rather than a character
+        # class in a regex.  The re_list property renders them in the old
+        # regex-ish form for humans.
+        self.fixed_letters: List[str] = [""] * word_length
+        self.forbidden_masks: List[int] = [0] * word_length
+        self.word_masks: Dict[str, int] = {}
+        self.position_bits: Dict[str, Tuple[int, ...]] = {}
+        self.packed_bits: Dict[str, int] = {}
+        self.unique_counts: Dict[str, int] = {}
+        self.response_codes: Dict[Tuple[str, str], int] = {}
+        # Width of one per-position "lane" in the packed representation;
+        # load_wordlist widens it if the alphabet needs more than ASCII.
+        self.lane_bits: int = 128
+        self.guessed: Set[str] = set()
+        # The constraint state as of the last full filter pass, so a turn
+        # that taught us nothing new doesn't rescan the whole list.
+        self.applied_state: Optional[
+            Tuple[int, int, Tuple[str, ...], Tuple[int, ...]]
+        ] = None
         self.wordlist: List[str] = []
         self.character_frequency: Mapping[str, Union[int, float]] = {}
         self.word_frequency: Mapping[str, Union[int, float]] = {}
@@ -82,6 +172,10 @@ class WordleSolver:
             )
         else:
             self.character_frequency = self.generate_frequencies()
+        self.char_weight_lut = self.build_char_weight_lut()
+        # A word's summed letter weight never changes once the frequency
+        # table is fixed, so cache them as they're computed.
+        self.word_weights: Dict[str, Union[int, float]] = {}
         # In any event, you're going to need character frequency here.
         if not self.current_guess:
             # Pick the most-common-letters-word from the wordlist
@@ -114,12 +208,89 @@ class WordleSolver:
         #
         # Words you're allowed to guess in Wordle are at:
         # https://gist.github.com/cfreshman/cdcdf777450c5b5301e439061d29694c
-        with open(filename, encoding="utf-8") as f:
-            wordlist = f.read().split()
-        wordlist = [x.lower() for x in wordlist]
-        wordlist = list(set(wordlist))  # Deduplicate
-        wordlist = [x for x in wordlist if len(x) == self.word_length]
+        # The read and parse are memoized per (file, length) up at module
+        # level; we take a mutable copy because the game winnows this
+        # list in place.
+        wordlist = list(read_words(filename, self.word_length))
         self.wordlist = wordlist
+        # Precompute the letter-presence bitmask for each word, so that
+        # apply_patterns can test set membership with single AND operations.
+        alphabet_top = max((ord(c) for w in wordlist for c in w), default=0)
+        self.lane_bits = max(self.lane_bits, alphabet_top + 1)
+        for w in wordlist:
+            self.get_word_mask(w)
+            self.get_position_bits(w)
+            self.get_packed_bits(w)
+            self.get_unique_count(w)
+
+    def get_word_mask(self, word: str) -> int:
+        """
+        Return (and cache) the letter-presence bitmask for a word: bit
+        ord(c) is set for each character c.  Indexing by ord() rather than
+        by ord(c) - ord('a') costs nothing (Python integers are arbitrary
+        precision) and keeps non-alphabetic puzzles like Primel and
+        Mastermind working.
+        """
+        mask = self.word_masks.get(word)
+        if mask is None:
+            mask = 0
+            for c in word:
+                mask |= 1 << ord(c)
+            self.word_masks[word] = mask
+        return mask
+
+    def get_position_bits(self, word: str) -> Tuple[int, ...]:
+        """
+        Return (and cache) the per-position letter bits for a word: one
+        single-bit integer per character.  This is the structure-of-arrays
+        counterpart to get_word_mask, so the positional filter can zip a
+        word against the allowed-letter masks without re-deriving ord()
+        per character every turn.
+        """
+        bits = self.position_bits.get(word)
+        if bits is None:
+            bits = tuple(1 << ord(c) for c in word)
+            self.position_bits[word] = bits
+        return bits
+
+    def get_packed_bits(self, word: str) -> Optional[int]:
+        """
+        Return (and cache) the word's positional bits packed into a
+        single wide integer, one lane of self.lane_bits bits per
+        position.  Since each position contributes exactly one bit, the
+        whole positional constraint check collapses to
+        'packed & allowed_packed == packed' -- the bit-parallel
+        (Shift-Or-style) trick, done with Python's bignums instead of
+        machine words.
+
+        Returns None for a word whose characters don't fit the lanes
+        (only possible for words injected after load); the caller falls
+        back to the lane-by-lane check for those.
+        """
+        packed = self.packed_bits.get(word)
+        if packed is None:
+            lane_bits = self.lane_bits
+            packed = 0
+            for idx, c in enumerate(word):
+                if ord(c) >= lane_bits:
+                    return None
+                packed |= 1 << (idx * lane_bits + ord(c))
+            self.packed_bits[word] = packed
+        return packed
+
+    def get_unique_count(self, word: str) -> int:
+        """
+        Return (and cache) the number of distinct letters in a word; it
+        never changes, so limit_repeats shouldn't rebuild a set to count
+        it every turn.  It's the popcount of the letter-presence mask,
+        so no set is ever allocated.  (bin().count() because we still
+        support Pythons older than 3.10's int.bit_count().)
+        """
+        count = self.unique_counts.get(word)
+        if count is None:
+            count = bin(self.get_word_mask(word)).count("1")
+            self.unique_counts[word] = count
+        return count
 
     def load_frequency_file(
         self, filename: str, char: bool = False
@@ -140,23 +311,29 @@ class WordleSolver:
         #  frequency files to match your wordlists, so you don't have to
         #  scan 1/3 of a million words each time you run.
         freq: Dict[str, int] = {}
-        self.log.debug(f"Loading frequency file {filename}")
+        self.log.debug("Loading frequency file %s", filename)
         l_num = 0
         word_length = self.word_length
         if char:
             word_length = 1
-        with open(filename, encoding="utf-8") as f:
+        # The frequency file can be enormous (a third of a million lines),
+        # so: read bytes and skip the text-decoding layer, hash-set
+        # membership rather than a scan of the wordlist per line, split
+        # only at the first gap, and decode the word / convert the count
+        # only for lines we keep (int() tolerates the trailing newline).
+        wl_set = frozenset(self.wordlist)
+        with open(filename, "rb") as f:
             for line in f:
                 l_num += 1
-                fields = line.strip().split()
-                word, count = fields[0], int(fields[1])
+                fields = line.split(None, 1)
+                word = fields[0].decode("utf-8")
                 if len(word) != word_length:
                     continue
-                if word not in self.wordlist and not char:
+                if not char and word not in wl_set:
                     continue
-                freq[word] = count
+                freq[word] = int(fields[1])
         if not char:
-            self.log.debug(f"Considered {l_num} words, kept {len(freq)}.")
+            self.log.debug("Considered %d words, kept %d.", l_num, len(freq))
         return freq
 
     def generate_frequencies(self) -> Dict[str, int]:
@@ -164,15 +341,17 @@ class WordleSolver:
         Generate character frequency from the actual word list (which is
         already lowercased and deduplicated).
         """
-        cf = {}
-        for w in self.wordlist:
-            for c in w:
-                if c not in cf:
-                    cf[c] = 1
-                else:
-                    cf[c] += 1
+        # One join, one Counter: the counting loop runs in C over a
+        # single buffer instead of a Python dict update per character,
+        # which is most of the "noticeable delay" the __init__ comment
+        # warns about on big dictionaries.  The module-level memo means
+        # successive solvers over the same list don't even pay that once.
+        cf = count_characters(tuple(self.wordlist))
         # Sorting here is purely for the debugging output to look prettier
-        #  and make it easier to see what the most common characters are.
+        #  and make it easier to see what the most common characters are,
+        #  so don't pay for it unless debugging is actually on.
+        if not self.log.isEnabledFor(logging.DEBUG):
+            return cf
         s_cf = self.sort_by_weight(cf)
         sorted_frequencies = {}
         for x in s_cf:
@@ -200,7 +379,7 @@ class WordleSolver:
         self.remove_guess()
         self.update_patterns()
         self.apply_patterns()
-        self.log.debug(f"Remaining word count: {len(self.wordlist)}")
+        self.log.debug("Remaining word count: %d", len(self.wordlist))
         best_guesses = self.get_best_guesses()
         if self.answer:
             self.current_guess = best_guesses[0]
@@ -244,11 +423,14 @@ class WordleSolver:
         if guess:
             self.current_guess = guess
             return
+        # Snapshot the allowed words as a set so each attempt is a hash
+        # lookup, not a scan of the whole list.
+        allowed = frozenset(self.wordlist)
         while True:
             guess = input("Guess word > ")
             guess = guess.lower()
             if len(guess) == self.word_length:
-                if guess in self.wordlist:
+                if guess in allowed:
                     break
             print(f"{guess} is not in the currently-allowed list.")
         self.current_guess = guess
@@ -275,115 +457,251 @@ class WordleSolver:
         """
         If we know the answer, calculate the response string.
         """
-        resp = ""
+        # The answer's letter mask is cached, so "is this letter in the
+        # answer" is a single AND rather than a substring search.  Build
+        # the response in a preallocated bytearray; growing a str one
+        # character at a time reallocates it every round.
+        answer = self.answer
+        answer_mask = self.get_word_mask(answer)
+        resp = bytearray(self.word_length)
         for idx, c in enumerate(self.current_guess):
-            if c == self.answer[idx]:
-                resp = f"{resp}!"
-                continue
-            if c in self.answer:
-                resp = f"{resp}?"
-                continue
-            resp = f"{resp}."
-        self.log.debug(f"Response is {resp}")
-        self.match_pattern = resp
+            if c == answer[idx]:
+                resp[idx] = ord("!")
+            elif answer_mask & (1 << ord(c)):
+                resp[idx] = ord("?")
+            else:
+                resp[idx] = ord(".")
+        self.match_pattern = resp.decode("ascii")
+        self.log.debug("Response is %s", self.match_pattern)
 
     def remove_guess(self) -> None:
         """
-        We now know *one* word that isn't the right answer.
+        We now know *one* word that isn't the right answer.  Just note it;
+        apply_patterns rebuilds the wordlist immediately afterwards anyway,
+        so an O(n) list.remove scan here would be pure waste.
         """
-        self.wordlist.remove(self.current_guess)
+        self.guessed.add(self.current_guess)
 
     def update_patterns(self) -> None:
         """
-        This builds the regular expression that matches possible correct
-        answers, and updates the sets of letters we know are, and are not,
-        in the answer.
+        This updates the per-position constraint masks, and the sets of
+        letters we know are, and are not, in the answer.  Each response
+        character costs one bitwise OR or set union; no strings are
+        rebuilt here.
         """
-        self.log.debug(f"current_guess: {self.current_guess}")
+        self.log.debug("current_guess: %s", self.current_guess)
         pattern = self.match_pattern
         for idx, ch in enumerate(pattern):
             c = self.current_guess[idx]
-            p_i = idx + 1
-            current_set = self.re_list[p_i]
-            if not current_set.startswith("[^") and current_set != ".":
+            if self.fixed_letters[idx]:
                 # We know what letter it is.  Keep going.
                 continue
             if ch == "!":
                 # This is correct
-                self.re_list[p_i] = c
-                self.include_letters = self.include_letters | {c}
+                self.fixed_letters[idx] = c
+                self.include_mask |= 1 << ord(c)
             elif ch == "?":
                 # This letter is in the word, but not in that place
-                if current_set == ".":
-                    current_set = f"[^{c}]"
-                else:
-                    setlets = str(current_set)[2:-1]
-                    current_lets = set(setlets)
-                    current_set = str(current_lets | {c})
-                    current_set = f"[^{''.join(current_set)}]"
-                self.re_list[p_i] = current_set
-                if c not in self.re_list:
-                    self.include_letters = self.include_letters | {c}
+                self.forbidden_masks[idx] |= 1 << ord(c)
+                if c not in self.fixed_letters:
+                    self.include_mask |= 1 << ord(c)
             elif ch == ".":
                 # Either the letter is not in the word, or it occurs in
                 # the word but we've found all the occurrences as either
-                # '!' or '?' already.  But if we've done that, it's in
-                # self.include_letters.
-                if c not in self.include_letters:
-                    self.exclude_letters = self.exclude_letters | {c}
+                # '!' or '?' already.  But if we've done that, its bit is
+                # in the include mask.
+                if not self.include_mask >> ord(c) & 1:
+                    self.exclude_mask |= 1 << ord(c)
             else:
                 raise ValueError(f"Response character {ch} not in '.?!'")
-        self.log.debug(f"include: {self.include_letters}")
-        self.log.debug(f"exclude: {self.exclude_letters}")
+        self.log.debug("include: %s", self.include_letters)
+        self.log.debug("exclude: %s", self.exclude_letters)
+
+    @property
+    def include_letters(self) -> Set[str]:
+        """
+        The letters we know are in the answer, as a set.  The mask is the
+        working representation; this is the friendly view of it.
+        """
+        return set(self.mask_to_letters(self.include_mask))
+
+    @include_letters.setter
+    def include_letters(self, letters: Set[str]) -> None:
+        mask = 0
+        for c in letters:
+            mask |= 1 << ord(c)
+        self.include_mask = mask
+
+    @property
+    def exclude_letters(self) -> Set[str]:
+        """
+        The letters we know are not in the answer, as a set.
+        """
+        return set(self.mask_to_letters(self.exclude_mask))
+
+    @exclude_letters.setter
+    def exclude_letters(self, letters: Set[str]) -> None:
+        mask = 0
+        for c in letters:
+            mask |= 1 << ord(c)
+        self.exclude_mask = mask
+
+    @property
+    def re_list(self) -> List[str]:
+        """
+        The positional constraints, rendered as the pieces of an anchored
+        regular expression.  Nothing filters with this anymore, but it's
+        a compact, human-readable summary of what we know, so it survives
+        for logging and for the tests.
+        """
+        pieces = ["^"]
+        for idx in range(self.word_length):
+            fixed = self.fixed_letters[idx]
+            if fixed:
+                pieces.append(fixed)
+            elif self.forbidden_masks[idx]:
+                pieces.append(
+                    f"[^{self.mask_to_letters(self.forbidden_masks[idx])}]"
+                )
+            else:
+                pieces.append(".")
+        pieces.append("$")
+        return pieces
+
+    def mask_to_letters(self, mask: int) -> str:
+        """
+        Decode a letter bitmask back into its characters (in ord() order).
+        """
+        # pylint: disable=no-self-use
+        letters = ""
+        while mask:
+            low_bit = mask & -mask
+            letters += chr(low_bit.bit_length() - 1)
+            mask ^= low_bit
+        return letters
 
     def apply_patterns(self) -> None:
         """
         Filter the wordlist based on the information we now have.
+
+        This is the hot path: it runs over every surviving word each turn.
+        Rather than building and matching a regular expression, we test
+        each word's precomputed letter bitmask against "required" and
+        "forbidden" masks (one AND apiece), and then check the positional
+        constraints the same way.
         """
         # First get rid of anything that doesn't have all of the letters we
         #  know we need, or has any letters we know we don't want.
         self.log.debug(
-            f"before applying patterns: {len(self.wordlist)} "
-            + "words remain."
+            "before applying patterns: %d words remain.", len(self.wordlist)
         )
-        filtered = []
-        for w in self.wordlist:
-            wset = set(w)
-            if self.exclude_letters:
-                overlap = self.exclude_letters & wset
-                if len(overlap) > 0:
-                    continue
-            if self.include_letters:
-                if self.include_letters <= wset:
-                    filtered.append(w)
-                    continue
+        required = self.include_mask
+        forbidden = self.exclude_mask
+        # If this turn taught us nothing new (say, a guess whose letters
+        # were all known already), the surviving list is still consistent
+        # with the constraints we last applied, so the rescan would keep
+        # every word: just drop used guesses.
+        state = (
+            required,
+            forbidden,
+            tuple(self.fixed_letters),
+            tuple(self.forbidden_masks),
+        )
+        if state == self.applied_state:
+            if self.guessed:
+                self.wordlist = [
+                    w for w in self.wordlist if w not in self.guessed
+                ]
+            self.log.debug(
+                "Constraints unchanged: %d words remain.", len(self.wordlist)
+            )
+            return
+        # Degenerate case: if we haven't learned anything yet, every word
+        # trivially survives, so don't bother testing them one by one.
+        if (
+            not required
+            and not forbidden
+            and not any(self.fixed_letters)
+            and not any(self.forbidden_masks)
+        ):
+            if self.guessed:
+                self.wordlist = [
+                    w for w in self.wordlist if w not in self.guessed
+                ]
+            self.log.debug(
+                "No constraints yet: %d words remain.", len(self.wordlist)
+            )
+            return
+        # Collapse each position to a single allowed-letters mask (one
+        # bit if the letter is fixed, everything-but-the-forbidden-bits
+        # otherwise).
+        allowed = []
+        for idx in range(self.word_length):
+            fixed = self.fixed_letters[idx]
+            if fixed:
+                allowed.append(1 << ord(fixed))
             else:
-                filtered.append(w)
-        self.log.debug(f"After filtering: {len(filtered)} words remain.")
+                allowed.append(~self.forbidden_masks[idx])
+        # Pack the per-position allowed masks into lanes of one wide
+        # integer.  Each word contributes exactly one bit per lane, so
+        # 'packed & allowed_packed == packed' holds exactly when every
+        # position's letter is allowed: the entire positional check is a
+        # single AND and compare, however long the word is.
+        lane_bits = self.lane_bits
+        lane_mask = (1 << lane_bits) - 1
+        allowed_packed = 0
+        for idx, a in enumerate(allowed):
+            allowed_packed |= (a & lane_mask) << (idx * lane_bits)
+        # One fused pass: letter-set tests and positional tests together,
+        # with the per-word lookups bound to locals so the scan avoids an
+        # attribute dispatch per word.  No dedup afterwards, either: the
+        # source list had no duplicates, so neither does this one.
+        get_word_mask = self.get_word_mask
+        get_packed_bits = self.get_packed_bits
+        get_position_bits = self.get_position_bits
+        guessed = self.guessed
         updated = []
-        re_str = "".join(self.re_list)
-        regex = re.compile(re_str)
-        self.log.debug(f"matching regex: {regex}")
-        for w in filtered:
-            if re.match(regex, w) is not None:
+        for w in self.wordlist:
+            if w in guessed:
+                continue
+            wmask = get_word_mask(w)
+            if wmask & forbidden:
+                continue
+            if wmask & required != required:
+                continue
+            packed = get_packed_bits(w)
+            if packed is not None:
+                if packed & allowed_packed == packed:
+                    updated.append(w)
+            elif all(b & a for b, a in zip(get_position_bits(w), allowed)):
+                # Injected word too exotic for the lanes; check it the
+                # slow way.
                 updated.append(w)
-        updated = list(set(updated))
         self.log.debug(
-            f"After regex application: {len(updated)} " + "words remain."
+            "After position filtering: %d words remain.", len(updated)
         )
         self.wordlist = updated
+        self.applied_state = state
 
     def get_best_guesses(self) -> List[str]:
         """
         Now we have a reduced wordlist, so we need to choose the best guesses
         from it, for some metric of "best."
 
-        If we have a word frequency file, we'll use that; otherwise we will
-        use letter frequency.
+        If we have a word frequency file, we'll use that; with entropy
+        enabled, we pick the guess whose responses would split the
+        remaining words most evenly; otherwise we will use letter
+        frequency.
         """
-        if self.word_frequency:
+        if len(self.wordlist) == 1:
+            # Only one candidate left; every metric would pick it, so
+            # don't bother scoring anything.
+            guesses = list(self.wordlist)
+        elif self.word_frequency:
             freqs = self.get_word_frequencies()
             guesses = self.apply_frequency_metric(freqs)
+        elif self.entropy:
+            guesses = self.apply_entropy_metric()
         else:
             weights = self.get_character_weights()
             weighted_guesses = self.sort_by_weight(weights)
@@ -401,18 +719,18 @@ class WordleSolver:
             self.log.info(g_log)
         return best_guess
 
-    def get_word_frequencies(self) -> Mapping[str, Union[int, float]]:
+    def get_word_frequencies(self) -> List[Tuple[str, Union[int, float]]]:
         """
-        This simply builds a dictionary mapping each remaining word to its
-        frequency.
+        This simply pairs each remaining word with its frequency.  It's a
+        list of tuples rather than a dictionary: the only consumer is
+        going to rank them, so there's no point paying to hash every word
+        into a fresh dict each turn.
         """
-        w_freq = {}
-        for w in self.wordlist:
-            w_freq[w] = self.word_frequency.get(w, 0)
-        return w_freq
+        lookup = self.word_frequency.get
+        return [(w, lookup(w, 0)) for w in self.wordlist]
 
     def apply_frequency_metric(
-        self, w_freq: Mapping[str, Union[int, float]]
+        self, w_freq: List[Tuple[str, Union[int, float]]]
     ) -> List[str]:
         """
         This is (currently) a placeholder that just returns more frequent
@@ -424,7 +742,73 @@ class WordleSolver:
         generally recognized, and it doesn't seem that Wordle tries to pick
         particularly nasty ones, so...this may never be useful.
         """
-        return self.sort_by_weight(w_freq)
+        return [x[0] for x in nlargest(self.top, w_freq, key=itemgetter(1))]
+
+    def build_char_weight_lut(self) -> List[Union[int, float]]:
+        """
+        Flatten character_frequency into a list indexed by ord(c).  An
+        indexed load is several times cheaper than hashing into a dict,
+        and get_character_weights does one per letter of every surviving
+        word every turn.  Characters with no recorded frequency weigh
+        nothing.
+        """
+        cf = self.character_frequency
+        size = max(map(ord, cf)) + 1 if cf else 1
+        lut: List[Union[int, float]] = [0] * size
+        for c, v in cf.items():
+            lut[ord(c)] = v
+        return lut
+
+    def get_response_code(self, guess: str, answer: str) -> int:
+        """
+        The response to a guess, packed as a base-3 integer (correct=2,
+        wrong-position=1, absent=0 per position).  Same semantics as
+        calculate_response, but an int is far cheaper to produce and
+        compare than a pattern string when we're scoring every
+        (guess, answer) pair.
+
+        Responses are memoized: each entropy turn scores a subset of the
+        pairs the previous turn scored, so later turns are nearly all
+        cache hits.
+        """
+        key = (guess, answer)
+        code = self.response_codes.get(key)
+        if code is None:
+            answer_mask = self.get_word_mask(answer)
+            code = 0
+            for idx, c in enumerate(guess):
+                code *= 3
+                if c == answer[idx]:
+                    code += 2
+                elif answer_mask & (1 << ord(c)):
+                    code += 1
+            self.response_codes[key] = code
+        return code
+
+    def apply_entropy_metric(self) -> List[str]:
+        """
+        Score each candidate guess by the Shannon entropy of its response
+        distribution across the remaining words, i.e. by how much we
+        expect to learn from guessing it.  This is the "real" metric the
+        frequency heuristics approximate; it's O(n^2) in the remaining
+        words, which pure Python can afford once the list has been
+        winnowed a bit (and that's why it's opt-in).
+        """
+        words = self.wordlist
+        n = len(words)
+        scores: Dict[str, float] = {}
+        get_response_code = self.get_response_code
+        for g in words:
+            counts: Dict[int, int] = {}
+            for a in words:
+                code = get_response_code(g, a)
+                counts[code] = counts.get(code, 0) + 1
+            entropy = 0.0
+            for k in counts.values():
+                p = k / n
+                entropy -= p * log2(p)
+            scores[g] = entropy
+        return self.sort_by_weight(scores, top=self.top)
 
     def get_character_weights(self) -> Dict[str, float]:
         """
@@ -435,19 +819,41 @@ class WordleSolver:
         It might also be superfluous.  The word list just isn't that large,
         for actual Wordle, anyway.
         """
-        weights = {}
-        for word in self.wordlist:
-            weights[word] = sum([self.character_frequency[c] for c in word])
-        return weights
+        # The sums don't change from turn to turn -- only the wordlist
+        # shrinks -- so after the first pass this is all cache hits.
+        get_word_weight = self.get_word_weight
+        return {word: get_word_weight(word) for word in self.wordlist}
+
+    def get_word_weight(self, word: str) -> Union[int, float]:
+        """
+        Return (and cache) the summed letter weight of a word, gathered
+        through the ord-indexed LUT: no dict hashing and no throwaway
+        lists.
+        """
+        weight = self.word_weights.get(word)
+        if weight is None:
+            lookup = self.char_weight_lut.__getitem__
+            weight = sum(map(lookup, map(ord, word)))
+            self.word_weights[word] = weight
+        return weight
 
     def sort_by_weight(
-        self, weights: Mapping[str, Union[int, float]]
+        self, weights: Mapping[str, Union[int, float]], top: int = 0
     ) -> List[str]:
         """
         Return the words with the highest weight (meaning, summed letter
         frequency, or word frequency) first.
+
+        If top is nonzero, only that many words are returned, selected
+        with heapq.nlargest: O(n log top) rather than the O(n log n) of a
+        full sort, and nlargest is documented to order ties exactly as
+        sorted() would.
         """
         # pylint: disable=no-self-use
+        if top:
+            return [
+                x[0] for x in nlargest(top, weights.items(), key=itemgetter(1))
+            ]
         return [
             x[0]
             for x in sorted(weights.items(), key=lambda y: y[1], reverse=True)
@@ -470,10 +876,10 @@ class WordleSolver:
                 return guesses
         diff_ltrs = {}
         for word in guesses:
-            diff_ltrs[word] = len(set(word))
+            diff_ltrs[word] = self.get_unique_count(word)
+        # The caller only ever shows self.top of these, so a partial
+        # selection suffices; ties keep the incoming (weight-sorted) order.
         return [
             x[0]
-            for x in sorted(
-                diff_ltrs.items(), key=lambda y: y[1], reverse=True
-            )
+            for x in nlargest(self.top, diff_ltrs.items(), key=itemgetter(1))
         ]
@@ -1,6 +1,7 @@
 """
 Test fixtures for our unit tests.
 """
+import copy
 from os.path import dirname, join
 from typing import Dict
 
@@ -27,13 +28,40 @@ def data() -> Dict[str, str]:
     }
 
 
-@pytest.fixture
-def standard_solver(
+@pytest.fixture(scope="session")
+def standard_solver_prototype(
     data: Dict[str, str]
 ) -> WordleSolver:  # pylint: disable=W0621
     """
-    Return a solver with usual Wordle parameters
+    Parse the standard word list and frequency file exactly once for the
+    whole test session.  Tests never see this instance directly; they get
+    cheap per-test clones of it from the standard_solver fixture.
     """
     return WordleSolver(
         word_list_file=data["5w"], character_frequency_file=data["sf"]
     )
+
+
+@pytest.fixture
+def standard_solver(
+    standard_solver_prototype: WordleSolver,
+) -> WordleSolver:  # pylint: disable=W0621
+    """
+    Return a solver with usual Wordle parameters.
+
+    This is a shallow copy of the session prototype with its own copies
+    of every structure a game mutates, so tests can run main_loop without
+    contaminating each other.  The per-word memo caches stay shared;
+    they're append-only and derived purely from the (immutable) words.
+    """
+    proto = standard_solver_prototype
+    w = copy.copy(proto)
+    w.wordlist = proto.wordlist.copy()
+    w.word_frequency = dict(proto.word_frequency)
+    w.include_letters = set()
+    w.exclude_letters = set()
+    w.fixed_letters = proto.fixed_letters.copy()
+    w.forbidden_masks = proto.forbidden_masks.copy()
+    w.guessed = set()
+    w.applied_state = None
+    return w
@@ -110,6 +110,21 @@ def test_custom_letter_frequencies(
     assert w.character_frequency != standard_solver.character_frequency
 
 
+def test_entropy_mode(data: Dict[str, str]) -> None:
+    """
+    Verify that entropy-based guess selection solves a puzzle.
+    """
+    w = WordleSolver(
+        word_list_file=data["5w"],
+        character_frequency_file=data["sf"],
+        answer="happy",
+        initial_guess="atone",
+        entropy=True,
+    )
+    w.main_loop()
+    assert w.current_guess == w.answer
+
+
 def test_word_freq(data: Dict[str, str]) -> None:
     """
     Verify that word and letter frequency behave differently.
@@ -163,24 +178,23 @@ def test_relax_repeats(data: Dict[str, str]) -> None:
     Verify that we get different answers if we turn off repeated-letter
     rejection or a known word list.
     """
-    w = WordleSolver(
-        word_list_file=data["5w"], answer="sissy", initial_guess="atone"
-    )
-    w.wordlist = ["atone", "kissy", "missy", "sissy"]
-    initial_length = len(w.wordlist)
-    w.main_loop()
-    first = w.attempt
-    assert first == initial_length  # Because all candidates already have
+    words = ["atone", "kissy", "missy", "sissy"]
+
+    def run(relax: bool) -> int:
+        w = WordleSolver(
+            word_list_file=data["5w"],
+            answer="sissy",
+            initial_guess="atone",
+            relax_repeats=relax,
+        )
+        w.wordlist = words.copy()
+        w.main_loop()
+        return w.attempt
+
+    first = run(False)
+    assert first == len(words)  # Because all candidates already have
     # 's' in them, the solver will choose 'sissy' last of all.
-    w = WordleSolver(
-        word_list_file=data["5w"],
-        answer="sissy",
-        initial_guess="atone",
-        relax_repeats=True,
-    )
-    w.wordlist = ["atone", "kissy", "missy", "sissy"]
-    w.main_loop()
-    assert w.attempt < first  # But 's' is more common than 'm' and 'k',
+    assert run(True) < first  # But 's' is more common than 'm' and 'k',
     # so this time it will have been chosen sooner.
 
 